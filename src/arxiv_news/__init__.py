@@ -3,5 +3,6 @@ __all__ = [
 	"ollama_filter",
 	"keyword_filter",
 	"ranking_agent",
+	"dedup_index",
 	"models",
 ]
@@ -11,12 +11,15 @@ from .models import Paper
 from .arxiv_fetcher import fetch_recent_papers, stream_recent_papers, fetch_paper_by_id
 from .ollama_filter import classify_paper, filter_interpretability
 from .keyword_filter import filter_by_keywords
-from .ranking_agent import tournament_rank_papers
+from .ranking_agent import tournament_rank_papers, count_ranking_calls
+from .dedup_index import DedupIndex
 from .config import (
 	ARXIV_DEFAULT_DAYS,
 	ARXIV_DEFAULT_LIMIT,
 	ARXIV_DEFAULT_NO_LIMIT,
 	CLASSIFICATION_MODEL,
+	DEDUP_ENABLED,
+	DEDUP_INDEX_PATH,
 	OLLAMA_URL,
 	OUTPUT_ALL_DIR,
 	OUTPUT_FILTERED_DIR,
@@ -44,7 +47,9 @@ def cli() -> None:
 @click.option("--ollama-url", type=str, default=OLLAMA_URL, show_default=True, help="Ollama base URL")
 @click.option("--out", type=click.Path(path_type=Path), default=None, help="Path to write JSONL")
 @click.option("--no-save", is_flag=True, default=False, help="Do not write output file")
-def fetch_and_filter(days: int, limit: int, no_limit: bool, model: str, ollama_url: str, out: Path | None, no_save: bool) -> None:
+@click.option("--dedup/--no-dedup", default=DEDUP_ENABLED, show_default=True, help="Reuse verdicts from previous runs via the dedup index")
+@click.option("--dedup-index", type=click.Path(path_type=Path), default=DEDUP_INDEX_PATH, show_default=True, help="Path to the persisted dedup index")
+def fetch_and_filter(days: int, limit: int, no_limit: bool, model: str, ollama_url: str, out: Path | None, no_save: bool, dedup: bool, dedup_index: Path) -> None:
 	"""
 	Fetch recent cs.AI papers, stream and print links as they arrive, then filter with
 	Ollama model, print and optionally save JSONL of matches.
@@ -94,7 +99,17 @@ def fetch_and_filter(days: int, limit: int, no_limit: bool, model: str, ollama_u
 	# =========================
 	# STEP 3: LLM INTERPRETABILITY FILTER
 	# =========================
-	matches = filter_interpretability(keyword_matches, model=model, url=ollama_url)
+	# Reuse verdicts for papers seen in previous runs (any version or near-duplicate)
+	index = DedupIndex.load(dedup_index) if dedup else None
+	if index is not None:
+		click.echo(f"Loaded dedup index with {len(index)} papers from {dedup_index}")
+
+	try:
+		matches = filter_interpretability(keyword_matches, model=model, url=ollama_url, index=index)
+	finally:
+		# Keep verdicts paid for so far, even if Ollama fails mid-run
+		if index is not None and not no_save:
+			index.save()
 
 	click.echo(f"Matches: {len(matches)} (filtered)")
 
@@ -124,17 +139,41 @@ def fetch_and_filter(days: int, limit: int, no_limit: bool, model: str, ollama_u
 	# matches = [Paper.model_validate_json(line) for line in Path("data/filtered/2025-10-03_07-05-53.jsonl").read_text().splitlines()]
 	# click.echo(f"Loaded {len(matches)} matches")
 	
-	ranking_result = tournament_rank_papers(matches, model=model, url=ollama_url)
-	click.echo("Final ranking result:")
-	click.echo(ranking_result)
-
-	# Save ranking result to data/ranked/
-	if not no_save:
-		ranked_path = OUTPUT_RANKED_DIR / f"{timestamp}.md"
-		ranked_path.parent.mkdir(parents=True, exist_ok=True)
-		with ranked_path.open("w", encoding="utf-8") as f:
-			f.write(ranking_result)
-		click.echo(f"Saved ranking result to {ranked_path}")
+	# Skip papers (or earlier versions of them) already ranked in a previous run
+	to_rank = matches
+	if index is not None:
+		to_rank = [p for p in matches if not index.was_ranked(p)]
+		index.ranking_skipped = len(matches) - len(to_rank)
+		index.ranking_calls_avoided = count_ranking_calls(len(matches)) - count_ranking_calls(len(to_rank))
+		click.echo(f"Skipping {index.ranking_skipped} papers already ranked in a previous run")
+
+	if matches and not to_rank:
+		click.echo("No new papers to rank.")
+	else:
+		ranking_result, ranking_ok = tournament_rank_papers(to_rank, model=model, url=ollama_url)
+		click.echo("Final ranking result:")
+		click.echo(ranking_result)
+
+		# Save ranking result to data/ranked/
+		if not no_save:
+			ranked_path = OUTPUT_RANKED_DIR / f"{timestamp}.md"
+			ranked_path.parent.mkdir(parents=True, exist_ok=True)
+			with ranked_path.open("w", encoding="utf-8") as f:
+				f.write(ranking_result)
+			click.echo(f"Saved ranking result to {ranked_path}")
+
+		# Only remember papers as ranked if every ranking call succeeded,
+		# otherwise they would be skipped in the next run
+		if index is not None:
+			if ranking_ok:
+				index.mark_ranked(to_rank)
+			else:
+				click.echo("Ranking had failed or empty LLM responses; papers will be ranked again next run")
+
+	if index is not None:
+		click.echo(index.summary())
+		if not no_save:
+			index.save()
 
 
 @cli.command(name="classify-id")
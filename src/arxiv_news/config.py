@@ -53,6 +53,17 @@ CLASSIFICATION_MODEL = _CONFIG["classification"]["model"]
 CLASSIFICATION_PROMPT = _CONFIG["classification"]["prompt"]
 
 
+# ============================================================================
+# Dedup Configuration
+# ============================================================================
+DEDUP_ENABLED = _CONFIG["dedup"]["enabled"]
+DEDUP_INDEX_PATH = Path(_CONFIG["dedup"]["index_path"])
+DEDUP_SIMILARITY_THRESHOLD = _CONFIG["dedup"]["similarity_threshold"]
+DEDUP_NUM_PERM = _CONFIG["dedup"]["num_perm"]
+DEDUP_BANDS = _CONFIG["dedup"]["bands"]
+DEDUP_SHINGLE_SIZE = _CONFIG["dedup"]["shingle_size"]
+
+
 # ============================================================================
 # Ranking Configuration
 # ============================================================================
@@ -94,6 +105,7 @@ def reload_config() -> None:
 	"""Reload configuration from disk (useful for testing/development)."""
 	global _CONFIG, ARXIV_CATEGORY, ARXIV_DEFAULT_DAYS, ARXIV_DEFAULT_LIMIT, ARXIV_DEFAULT_NO_LIMIT
 	global OLLAMA_URL, KEYWORD_LIST, CLASSIFICATION_MODEL, CLASSIFICATION_PROMPT
+	global DEDUP_ENABLED, DEDUP_INDEX_PATH, DEDUP_SIMILARITY_THRESHOLD, DEDUP_NUM_PERM, DEDUP_BANDS, DEDUP_SHINGLE_SIZE
 	global RANKING_MODEL, RANKING_TOURNAMENT_TOPK, RANKING_PROMPT_TEMPLATE
 	global OUTPUT_BASE_DIR, OUTPUT_ALL_DIR, OUTPUT_FILTERED_DIR, OUTPUT_RANKED_DIR
 	
@@ -111,6 +123,13 @@ def reload_config() -> None:
 	CLASSIFICATION_MODEL = _CONFIG["classification"]["model"]
 	CLASSIFICATION_PROMPT = _CONFIG["classification"]["prompt"]
 	
+	DEDUP_ENABLED = _CONFIG["dedup"]["enabled"]
+	DEDUP_INDEX_PATH = Path(_CONFIG["dedup"]["index_path"])
+	DEDUP_SIMILARITY_THRESHOLD = _CONFIG["dedup"]["similarity_threshold"]
+	DEDUP_NUM_PERM = _CONFIG["dedup"]["num_perm"]
+	DEDUP_BANDS = _CONFIG["dedup"]["bands"]
+	DEDUP_SHINGLE_SIZE = _CONFIG["dedup"]["shingle_size"]
+	
 	RANKING_MODEL = _CONFIG["ranking"]["model"]
 	RANKING_TOURNAMENT_TOPK = _CONFIG["ranking"]["tournament_topk"]
 	
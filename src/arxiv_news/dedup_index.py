@@ -0,0 +1,321 @@
+"""
+Persistent dedup index for arxiv-news.
+Matches papers against verdicts from previous runs by normalized arXiv ID
+(version suffix stripped) and by MinHash/LSH similarity over title+abstract
+shingles, so replacements and reposts can reuse a prior verdict instead of
+going through the LLM again.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from .models import Paper, ClassificationResult
+from .config import (
+	DEDUP_INDEX_PATH,
+	DEDUP_SIMILARITY_THRESHOLD,
+	DEDUP_NUM_PERM,
+	DEDUP_BANDS,
+	DEDUP_SHINGLE_SIZE,
+)
+
+
+# Mersenne prime used for the universal hash family (h(x) = (a*x + b) mod p)
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Fixed seed so permutations (and thus stored signatures) are stable across runs
+_PERM_SEED = 1
+
+# New-style (2510.02307v1) and old-style (cs/0101001v2, math.AG/0101001) arXiv IDs
+_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})(v\d+)?")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class IndexEntry(BaseModel):
+	arxiv_id: str
+	version: str | None = None
+	title: str
+	is_interpretability: bool
+	reason: str | None = None
+	ranked: bool = False
+	signature: List[int] | None = None
+
+
+class DedupMatch(BaseModel):
+	entry: IndexEntry
+	matched_by: str  # "id" or "minhash"
+	similarity: float
+
+
+def normalize_arxiv_id(link: str) -> Tuple[str, str | None]:
+	"""
+	Extract the arXiv ID from a link and split off its version suffix.
+	E.g. "http://arxiv.org/pdf/2510.02307v1" -> ("2510.02307", "v1").
+	Falls back to the stripped link itself if no ID is recognised.
+	"""
+	match = _ARXIV_ID_RE.search(link)
+	if match is None:
+		return link.strip(), None
+	return match.group(1), match.group(2)
+
+
+def _version_number(version: str | None) -> int:
+	""""v3" -> 3; missing versions sort first."""
+	return int(version[1:]) if version else 0
+
+
+def _shingles(text: str, size: int) -> Set[str]:
+	"""Lowercased word n-gram shingles; short texts fall back to a single shingle."""
+	tokens = _TOKEN_RE.findall(text.lower())
+	if len(tokens) <= size:
+		return {" ".join(tokens)} if tokens else set()
+	return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def _stable_hash(shingle: str) -> int:
+	"""32-bit hash that, unlike hash(), does not change between interpreter runs."""
+	return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class DedupIndex:
+	"""
+	ID + MinHash/LSH index of prior classification verdicts, persisted as JSON.
+	Signatures are split into `bands` bands; papers sharing any band bucket are
+	candidates, and a candidate matches if its estimated Jaccard similarity is
+	at least `threshold`.
+	"""
+
+	def __init__(
+		self,
+		path: Path = DEDUP_INDEX_PATH,
+		threshold: float = DEDUP_SIMILARITY_THRESHOLD,
+		num_perm: int = DEDUP_NUM_PERM,
+		bands: int = DEDUP_BANDS,
+		shingle_size: int = DEDUP_SHINGLE_SIZE,
+	) -> None:
+		if num_perm % bands != 0:
+			raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+		self.path = Path(path)
+		self.threshold = threshold
+		self.num_perm = num_perm
+		self.bands = bands
+		self.rows = num_perm // bands
+		self.shingle_size = shingle_size
+
+		rng = random.Random(_PERM_SEED)
+		self._perms = [
+			(rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+			for _ in range(num_perm)
+		]
+		self._entries: Dict[str, IndexEntry] = {}
+		self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = defaultdict(list)
+
+		# Run statistics
+		self.id_hits = 0
+		self.minhash_hits = 0
+		self.misses = 0
+		self.ranking_skipped = 0
+		self.ranking_calls_avoided = 0
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	@property
+	def classification_calls_avoided(self) -> int:
+		"""Classification calls avoided by reusing a prior verdict."""
+		return self.id_hits + self.minhash_hits
+
+	@property
+	def llm_calls_avoided(self) -> int:
+		"""All LLM calls avoided: reused classifications plus ranking calls not needed."""
+		return self.classification_calls_avoided + self.ranking_calls_avoided
+
+	# ------------------------------------------------------------------
+	# Persistence
+	# ------------------------------------------------------------------
+
+	@classmethod
+	def load(cls, path: Path = DEDUP_INDEX_PATH, **kwargs) -> "DedupIndex":
+		"""
+		Load the index from disk, or return an empty one if the file does not exist
+		or cannot be decoded.
+		If the stored MinHash parameters differ from the current ones, stored
+		signatures are dropped and recomputed the next time each paper is seen.
+		"""
+		index = cls(path=path, **kwargs)
+		if not index.path.exists():
+			return index
+
+		try:
+			with index.path.open("r", encoding="utf-8") as f:
+				data = json.load(f)
+			params = data.get("params", {})
+			compatible = (
+				params.get("num_perm") == index.num_perm
+				and params.get("shingle_size") == index.shingle_size
+				and params.get("seed") == _PERM_SEED
+			)
+			entries = [IndexEntry.model_validate(raw) for raw in data.get("entries", [])]
+		except (ValueError, AttributeError, TypeError, ValidationError) as e:
+			# ValueError covers JSONDecodeError and UnicodeDecodeError
+			print(f"Dedup index {index.path} is corrupt, starting with an empty index: {e}")
+			return index
+
+		if not compatible:
+			print(f"Dedup index parameters changed, dropping stored signatures until papers are seen again: {params}")
+
+		for entry in entries:
+			if not compatible:
+				entry.signature = None
+			index._insert(entry)
+		return index
+
+	def save(self) -> None:
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		data = {
+			"params": {
+				"num_perm": self.num_perm,
+				"shingle_size": self.shingle_size,
+				"seed": _PERM_SEED,
+			},
+			"entries": [entry.model_dump() for entry in self._entries.values()],
+		}
+		# Write to a temp file and swap it in, so an interrupted save never truncates the index
+		fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+		try:
+			with os.fdopen(fd, "w", encoding="utf-8") as f:
+				json.dump(data, f, ensure_ascii=False)
+			os.replace(tmp_path, self.path)
+		except BaseException:
+			os.unlink(tmp_path)
+			raise
+
+	# ------------------------------------------------------------------
+	# MinHash / LSH
+	# ------------------------------------------------------------------
+
+	def _signature(self, paper: Paper) -> List[int]:
+		hashes = [_stable_hash(s) for s in _shingles(f"{paper.title} {paper.abstract}", self.shingle_size)]
+		if not hashes:
+			return [_MAX_HASH] * self.num_perm
+		return [
+			min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+			for a, b in self._perms
+		]
+
+	def _band_keys(self, signature: List[int]) -> List[Tuple[int, Tuple[int, ...]]]:
+		return [
+			(band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+			for band in range(self.bands)
+		]
+
+	@staticmethod
+	def _similarity(sig_a: List[int], sig_b: List[int]) -> float:
+		return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+	def _insert(self, entry: IndexEntry) -> None:
+		self._entries[entry.arxiv_id] = entry
+		if entry.signature is not None:
+			for key in self._band_keys(entry.signature):
+				self._buckets[key].append(entry.arxiv_id)
+
+	def _remove_from_buckets(self, entry: IndexEntry) -> None:
+		if entry.signature is None:
+			return
+		for key in self._band_keys(entry.signature):
+			bucket = self._buckets.get(key)
+			if bucket and entry.arxiv_id in bucket:
+				bucket.remove(entry.arxiv_id)
+				if not bucket:
+					del self._buckets[key]
+
+	# ------------------------------------------------------------------
+	# Public API
+	# ------------------------------------------------------------------
+
+	def lookup(self, paper: Paper) -> Optional[DedupMatch]:
+		"""
+		Return the prior verdict for this paper if one exists: first by normalized
+		arXiv ID (any version), then by MinHash similarity above the threshold.
+		Updates hit/miss statistics. On an ID hit with a newer version, or for an
+		entry whose signature was dropped, the stored version, title and signature
+		are refreshed from this paper.
+		"""
+		arxiv_id, version = normalize_arxiv_id(str(paper.link))
+		entry = self._entries.get(arxiv_id)
+		if entry is not None:
+			self.id_hits += 1
+			newer = _version_number(version) > _version_number(entry.version)
+			if newer or entry.signature is None:
+				self._remove_from_buckets(entry)
+				if newer:
+					entry.version = version
+				entry.title = paper.title
+				entry.signature = self._signature(paper)
+				self._insert(entry)
+			return DedupMatch(entry=entry, matched_by="id", similarity=1.0)
+
+		signature = self._signature(paper)
+		best: Optional[DedupMatch] = None
+		seen: Set[str] = set()
+		for key in self._band_keys(signature):
+			for candidate_id in self._buckets.get(key, ()):
+				if candidate_id in seen:
+					continue
+				seen.add(candidate_id)
+				candidate = self._entries[candidate_id]
+				similarity = self._similarity(signature, candidate.signature)
+				if similarity >= self.threshold and (best is None or similarity > best.similarity):
+					best = DedupMatch(entry=candidate, matched_by="minhash", similarity=similarity)
+
+		if best is None:
+			self.misses += 1
+		else:
+			self.minhash_hits += 1
+		return best
+
+	def add(self, paper: Paper, result: ClassificationResult, ranked: bool = False) -> IndexEntry:
+		"""Record a verdict for this paper, keyed by its normalized arXiv ID."""
+		arxiv_id, version = normalize_arxiv_id(str(paper.link))
+		entry = IndexEntry(
+			arxiv_id=arxiv_id,
+			version=version,
+			title=paper.title,
+			is_interpretability=result.is_interpretability,
+			reason=result.reason,
+			ranked=ranked,
+			signature=self._signature(paper),
+		)
+		self._insert(entry)
+		return entry
+
+	def was_ranked(self, paper: Paper) -> bool:
+		"""True if this paper (by ID) was already part of a previous ranking run."""
+		arxiv_id, _ = normalize_arxiv_id(str(paper.link))
+		entry = self._entries.get(arxiv_id)
+		return entry is not None and entry.ranked
+
+	def mark_ranked(self, papers: List[Paper]) -> None:
+		for paper in papers:
+			arxiv_id, _ = normalize_arxiv_id(str(paper.link))
+			entry = self._entries.get(arxiv_id)
+			if entry is not None:
+				entry.ranked = True
+
+	def summary(self) -> str:
+		return (
+			f"Dedup: {self.llm_calls_avoided} LLM calls avoided "
+			f"({self.classification_calls_avoided} classification: {self.id_hits} by ID, {self.minhash_hits} by MinHash; "
+			f"{self.ranking_calls_avoided} ranking), "
+			f"{self.misses} new, {self.ranking_skipped} papers skipped from ranking, "
+			f"{len(self)} papers in index"
+		)
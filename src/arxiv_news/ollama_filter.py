@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 import requests
 
 from .models import Paper, ClassificationResult
 from .config import OLLAMA_URL, CLASSIFICATION_MODEL, CLASSIFICATION_PROMPT
+from .dedup_index import DedupIndex
+
+_UNPARSEABLE_REASON = "Unparseable model output"
 
 
 def _call_ollama_generate(model: str, prompt: str, url: str = OLLAMA_URL) -> str:
@@ -43,13 +46,34 @@ def classify_paper(paper: Paper, model: str = CLASSIFICATION_MODEL, url: str = O
 		return ClassificationResult(is_interpretability=is_interpretability, reason=reason)
 	except Exception:
 		# Fallback: conservative false if invalid response
-		return ClassificationResult(is_interpretability=False, reason="Unparseable model output")
+		return ClassificationResult(is_interpretability=False, reason=_UNPARSEABLE_REASON)
 
 
-def filter_interpretability(papers: Iterable[Paper], model: str = CLASSIFICATION_MODEL, url: str = OLLAMA_URL) -> List[Paper]:
+def filter_interpretability(
+	papers: Iterable[Paper],
+	model: str = CLASSIFICATION_MODEL,
+	url: str = OLLAMA_URL,
+	index: Optional[DedupIndex] = None,
+) -> List[Paper]:
+	"""
+	Classify papers and keep the interpretability matches. If a dedup index is given,
+	papers matching a prior verdict (same arXiv ID or near-duplicate text) reuse it
+	instead of calling the LLM, and new verdicts are recorded in the index.
+	"""
 	kept: List[Paper] = []
 	for paper in papers:
-		res = classify_paper(paper, model=model, url=url)
+		match = index.lookup(paper) if index is not None else None
+		if match is not None:
+			res = ClassificationResult(is_interpretability=match.entry.is_interpretability, reason=match.entry.reason)
+			print(f"Title: {paper.title}\nURL: {paper.link}\nReused verdict of arXiv:{match.entry.arxiv_id} ({match.matched_by}, similarity={match.similarity:.2f})")
+			if match.matched_by == "minhash":
+				# Record the new ID so later runs hit it directly
+				index.add(paper, res, ranked=match.entry.ranked)
+		else:
+			res = classify_paper(paper, model=model, url=url)
+			# Don't persist the fallback verdict; retry the paper next run instead
+			if index is not None and res.reason != _UNPARSEABLE_REASON:
+				index.add(paper, res)
 		if res.is_interpretability:
 			kept.append(paper)
 	return kept
@@ -53,6 +53,22 @@ def _create_batches(papers: List[Paper], batch_size: int = 10) -> List[List[Pape
 	return batches
 
 
+def count_ranking_calls(num_papers: int, batch_size: int = 10) -> int:
+	"""
+	Number of LLM calls `tournament_rank_papers` makes for the given number of papers.
+	"""
+	if num_papers == 0:
+		return 0
+	_, final_top_k = RANKING_TOURNAMENT_TOPK
+	if num_papers <= final_top_k:
+		return 1
+	# Same batch count as _create_batches: batches of 10, a last batch of 4 or fewer is merged
+	num_batches = -(-num_papers // batch_size)
+	if num_papers > batch_size and 1 <= num_papers % batch_size <= 4:
+		num_batches -= 1
+	return num_batches + 1
+
+
 def _rank_batch(batch_string: str, num: int, model: str = RANKING_MODEL, url: str = OLLAMA_URL) -> str:
 	"""
 	Rank papers using LLM and return plain text response.
@@ -74,16 +90,17 @@ def _rank_batch(batch_string: str, num: int, model: str = RANKING_MODEL, url: st
 		return ""
 
 
-def tournament_rank_papers(papers: List[Paper], model: str = RANKING_MODEL, url: str = OLLAMA_URL) -> str:
+def tournament_rank_papers(papers: List[Paper], model: str = RANKING_MODEL, url: str = OLLAMA_URL) -> Tuple[str, bool]:
 	"""
 	Two-level tournament ranking using configurable top-k values.
 	First stage: rank batches, get text responses
 	Second stage: rank all batch results, return final text
+	Returns (result_text, ok); ok is False if any LLM ranking call failed or came back empty.
 
     TODO: might want to also preserve arxiv links/ids
 	"""
 	if not papers:
-		return "No papers to rank."
+		return "No papers to rank.", True
 	
 	first_top_k, final_top_k = RANKING_TOURNAMENT_TOPK
 	
@@ -115,9 +132,10 @@ def tournament_rank_papers(papers: List[Paper], model: str = RANKING_MODEL, url:
 	batch_results_string = "\n\n".join(batch_results)
 	final_result = _rank_batch(batch_results_string, num=final_top_k, model=model, url=url)
 	
+	ok = bool(final_result) and all(batch_results)
 	return (
 		final_result +
 		"\n\n\n\n### --------------- Ranked results for each batch: --------------------\n" +
 		batch_results_string
-	)
+	), ok
 